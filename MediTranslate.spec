@@ -6,7 +6,7 @@ a = Analysis(
     pathex=['src/meditranslate'],
     binaries=[],
     datas=[('/home/ishan/Documents/MediTranslate/src/meditranslate/data', 'meditranslate/data'), ('/home/ishan/Documents/MediTranslate/src/meditranslate/resources', 'meditranslate/resources'), ('/home/ishan/Documents/MediTranslate/.env', '.')],
-    hiddenimports=['pdf2image', 'reportlab', 'pyside6', 'cv2', 'numpy', 'ui', 'services', 'utils'],
+    hiddenimports=['pymupdf', 'reportlab', 'pyside6', 'cv2', 'numpy', 'ui', 'services', 'utils'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -32,7 +32,7 @@ def build():
         
         *[f'--add-data={arg}' for arg in data_args],
         
-        '--hidden-import=pdf2image',
+        '--hidden-import=pymupdf',
         '--hidden-import=reportlab',
         '--hidden-import=pyside6',
         '--hidden-import=cv2',
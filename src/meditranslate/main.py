@@ -11,6 +11,7 @@ import traceback
 from loguru import logger
 from PySide6.QtWidgets import QApplication, QMessageBox
 from meditranslate.services.translation_service import TranslationService
+from meditranslate.utils.paths import get_resource_path
 
 def check_and_download_models():
     """
@@ -77,6 +78,8 @@ def main():
         
         app.setStyle("Fusion")
         app.setApplicationName("MediTranslate")
+        # Parsed once here and shared by every widget, rather than per-widget setStyleSheet calls
+        app.setStyleSheet(get_resource_path("resources/styles.qss").read_text(encoding="utf-8"))
         
         # 1. Check Models BEFORE showing UI
         if not check_and_download_models():
@@ -9,13 +9,18 @@ Features:
 import os
 import time
 import random
+import hashlib
+import threading
 from pathlib import Path
 from loguru import logger
 from dotenv import load_dotenv
-from google import genai
 
 class AIAssistant:
     def __init__(self):
+        # (term, lang, context digest) -> explanation. In memory only: responses quote patient documents.
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+
         # Try Loading Key from Environment or Home Directory
         # Priority: Env Var > Local .env > Home Dir .env
         api_key = os.getenv("GEMINI_API_KEY")
@@ -35,16 +40,34 @@ class AIAssistant:
             return
 
         try:
+            # Imported only when a key exists; the SDK is heavy and unused otherwise
+            from google import genai
             self.client = genai.Client(api_key=self.api_key)
             logger.info("Gemini AI Client initialized.")
         except Exception as e:
             logger.error(f"Failed to connect to Gemini: {e}")
             self.client = None
 
+    @staticmethod
+    def _cache_key(term, full_context, target_lang):
+        digest = hashlib.blake2b(full_context[:2000].encode("utf-8"), digest_size=16).digest()
+        return (term.strip().lower(), target_lang, digest)
+
+    def cached_explanation(self, term, full_context, target_lang):
+        """
+        Returns a previous successful explanation for this term and document, or None.
+        """
+        with self._cache_lock:
+            return self._cache.get(self._cache_key(term, full_context, target_lang))
+
     def explain_term(self, term, local_def, full_context, target_lang):
         """
         Generates explanation with retry logic.
         """
+        cached = self.cached_explanation(term, full_context, target_lang)
+        if cached is not None:
+            return cached
+
         if not self.client:
             return "AI Error: Client not active. Please add GEMINI_API_KEY to your ~/.env file."
 
@@ -83,7 +106,7 @@ class AIAssistant:
                     contents=prompt,
                     config={'temperature': 0.75}
                 )
-                return response.text
+                return self._remember(term, full_context, target_lang, response.text)
 
             except Exception as e:
                 error_str = str(e)
@@ -93,17 +116,24 @@ class AIAssistant:
                     time.sleep(wait_time)
                     
                     if attempt == max_retries - 1:
-                        return self._fallback_generation(prompt)
+                        return self._fallback_generation(prompt, (term, full_context, target_lang))
                 
                 elif "404" in error_str:
-                    return self._fallback_generation(prompt)
+                    return self._fallback_generation(prompt, (term, full_context, target_lang))
                 
                 else:
                     return f"Error connecting to AI: {str(e)}"
         
         return "AI Service busy. Please try again."
 
-    def _fallback_generation(self, prompt):
+    def _remember(self, term, full_context, target_lang, text):
+        # Only real answers are cached; error strings must stay retryable
+        if text:
+            with self._cache_lock:
+                self._cache[self._cache_key(term, full_context, target_lang)] = text
+        return text
+
+    def _fallback_generation(self, prompt, cache_args):
         try:
             logger.info("Falling back to Flash Lite...")
             response = self.client.models.generate_content(
@@ -111,6 +141,6 @@ class AIAssistant:
                 contents=prompt,
                 config={'temperature': 0.75}
             )
-            return response.text
+            return self._remember(*cache_args, response.text)
         except Exception as e:
             return f"System Error: All AI models failed. {e}"
\ No newline at end of file
@@ -6,7 +6,7 @@ Features:
 - Primary Brain (Curated Glossary)
 - Backup Brain (ICD-10) 
 - Regex Pattern Matching
-- Translation Wrapper
+- Translation Wrapper (single & batched; cached in TranslationService)
 """
 import json
 import re
@@ -14,6 +14,20 @@ from loguru import logger
 from meditranslate.services.translation_service import TranslationService
 from meditranslate.utils.paths import get_resource_path
 
+# Document types in priority order; the first group with any keyword (substring match) wins
+_DOC_TYPES = [
+    ("rx", "Prescription / Medication List", ["rx", "prescription", "pharmacy", "take", "daily", "tablet"]),
+    ("lab", "Laboratory Report", ["lab", "metabolic", "count", "positive", "negative", "range", "result"]),
+    ("discharge", "Discharge Summary", ["discharge", "summary", "admitted", "hospital", "instructions"]),
+    ("clinical", "Clinical Note", ["diagnosis", "history", "assessment", "plan"]),
+]
+# One alternation scanned once, instead of a separate `in` pass per keyword.
+# Zero-width lookahead so overlapping keywords ("count" / "take") are all seen.
+_DOC_TYPE_RE = re.compile("(?=" + "|".join(
+    f"(?P<{group}>{'|'.join(map(re.escape, words))})" for group, _, words in _DOC_TYPES
+) + ")")
+_DOC_TYPE_PRIORITY = {group: i for i, (group, _, _) in enumerate(_DOC_TYPES)}
+
 class AnalysisService:
     def __init__(self):
         self.translator = None
@@ -80,22 +94,15 @@ class AnalysisService:
 
     def detect_document_type(self, text: str) -> str:
         """
-        Classifies the document based on keywords.
+        Classifies the document based on keywords (single regex pass, highest priority wins).
         """
-        text_lower = text.lower()
-        
-        # Simple Keyword Voting
-        if any(x in text_lower for x in ["rx", "prescription", "pharmacy", "take", "daily", "tablet"]):
-            return "Prescription / Medication List"
+        best = len(_DOC_TYPES)
+        for match in _DOC_TYPE_RE.finditer(text.lower()):
+            best = min(best, _DOC_TYPE_PRIORITY[match.lastgroup])
+            if best == 0: break
         
-        if any(x in text_lower for x in ["lab", "metabolic", "count", "positive", "negative", "range", "result"]):
-            return "Laboratory Report"
-            
-        if any(x in text_lower for x in ["discharge", "summary", "admitted", "hospital", "instructions"]):
-            return "Discharge Summary"
-            
-        if any(x in text_lower for x in ["diagnosis", "history", "assessment", "plan"]):
-            return "Clinical Note"
+        if best < len(_DOC_TYPES):
+            return _DOC_TYPES[best][1]
             
         return "General Medical Document"
 
@@ -166,4 +173,16 @@ class AnalysisService:
         try:
             return self.translator.translate(text, target_lang)
         except Exception as e:
-            return f"[Error]: {str(e)}"
\ No newline at end of file
+            return f"[Error]: {str(e)}"
+
+    def translate_batch(self, texts: list[str], target_lang: str) -> list[str]:
+        """
+        Translates a list of strings in one go.
+        On failure raises RuntimeError whose message is meant for the user (shown once, not per entry).
+        """
+        if self.translator is None:
+            raise RuntimeError(f"[System Error]: Translator not active.\nReason: {self.init_error}")
+        try:
+            return self.translator.translate_batch(texts, target_lang)
+        except Exception as e:
+            raise RuntimeError(f"[Error]: {str(e)}") from e
\ No newline at end of file
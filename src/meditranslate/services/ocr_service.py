@@ -1,7 +1,17 @@
 """
 src/services/ocr_service.py
 Handles the Optical Character Recognition (OCR) logic.
+Tesseract is kept single-threaded; for multi-page jobs, run pages
+side by side from a ThreadPoolExecutor instead.
 """
+import os
+# Tesseract's own OpenMP threading is slower than one thread per page
+# (https://github.com/tesseract-ocr/tesseract/issues/898). pytesseract runs
+# tesseract as a child process, so this only needs to be in our env.
+# OMP_NUM_THREADS is left alone on purpose: torch reads it and would drop
+# the translation models to a single thread.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
 import pytesseract
 from loguru import logger
 import numpy as np
@@ -9,7 +19,9 @@ import numpy as np
 class OCRService:
     def __init__(self):
         logger.info("OCRService initialized")
+        logger.info(f"Tesseract OMP_THREAD_LIMIT={os.environ.get('OMP_THREAD_LIMIT')}; pages are parallelised by the caller")
         self._check_tesseract()
+        self._warmup()
 
     def _check_tesseract(self):
         try:
@@ -18,6 +30,13 @@ class OCRService:
         except Exception as e:
             logger.critical(f"Tesseract not found: {e}")
 
+    def _warmup(self):
+        # One tiny OCR pass so the first real scan doesn't pay for loading language data
+        try:
+            pytesseract.image_to_string(np.zeros((32, 32), dtype=np.uint8))
+        except Exception as e:
+            logger.warning(f"Tesseract warmup failed: {e}")
+
     def extract_text(self, image: np.ndarray, lang: str = 'eng') -> str:
         if image is None: return ""
             
@@ -36,11 +55,10 @@ class OCRService:
             print(text)
             print("=== RAW OCR OUTPUT END ===\n")
             
-            if not text.strip():
-                return "[No text detected. Try Enhancing the image.]"
-            
+            # Empty string means "nothing found"; callers decide how to tell the user
             return text.strip()
             
         except Exception as e:
             logger.error(f"OCR Failed: {e}")
-            return f"Error reading document: {e}"
\ No newline at end of file
+            # Raised, not returned: an error string would be treated (and cached) as document text
+            raise RuntimeError(f"Error reading document: {e}") from e
\ No newline at end of file
@@ -2,13 +2,51 @@
 src/services/translation_service.py
 Handles loading AI models and performing translation.
 """
+import hashlib
+import os
+import shutil
+import threading
+from collections import OrderedDict
+import torch
 from loguru import logger
 from transformers import MarianMTModel, MarianTokenizer
 from meditranslate.utils.paths import get_resource_path
 
+# --- TRANSLATION CACHE (shared by every service instance in the process) ---
+# Medical terms repeat a lot across scans. Memory only: patient text is never written to disk.
+_CACHE_SIZE = 5000
+_cache_lock = threading.Lock()
+_CACHE = OrderedDict()
+
+def _cache_key(text, target_lang, *variant):
+    return (hashlib.blake2b(text.strip().encode("utf-8"), digest_size=16).digest(), target_lang, *variant)
+
+def _cache_get(key):
+    with _cache_lock:
+        if key not in _CACHE: return None
+        _CACHE.move_to_end(key)
+        return _CACHE[key]
+
+def _cache_put(key, value):
+    with _cache_lock:
+        _CACHE[key] = value
+        _CACHE.move_to_end(key)
+        if len(_CACHE) > _CACHE_SIZE: _CACHE.popitem(last=False)
+
+def _cpu_supports_bf16():
+    # Private torch helper that not every build has; missing means unsupported
+    check = getattr(torch.cpu, "_is_avx512_bf16_supported", None)
+    return bool(check and check())
+
 class TranslationService:
     
-    def __init__(self):
+    def __init__(self, quantize: bool = False, bf16: bool = False):
+        # Opt-in int8 dynamic quantization of the Linear layers (smaller, faster on CPU, slightly lossy)
+        self.quantize = quantize
+        # Opt-in bfloat16 weights, only where the CPU has native bf16 math; int8 takes precedence
+        self.dtype = torch.bfloat16 if bf16 and not quantize and _cpu_supports_bf16() else None
+        # Different weights can give different output, so they don't share cache entries
+        self._cache_variant = (self.quantize, self.dtype)
         self.models = {} 
         self.tokenizers = {}
         
@@ -18,42 +56,106 @@ class TranslationService:
             "Spanish": "Helsinki-NLP/opus-mt-en-es",
             "Hindi": "Helsinki-NLP/opus-mt-en-hi",
         }
+        # One lock per language: concurrent loads of different models don't block each other
+        self._load_locks = {lang: threading.Lock() for lang in self.model_map}
         
         logger.info(f"Translation Service initialized.")
         logger.info(f"Looking for models at: {self.model_dir}")
 
     def load_model(self, target_lang):
         """
-        Loads the specific model for English -> Target Language.
+        Loads the specific model for English -> Target Language and returns it.
+        Idempotent: an already-loaded model is returned without touching disk.
         """
         model_name = self.model_map.get(target_lang)
         if not model_name:
             raise ValueError(f"Unsupported language: {target_lang}")
             
-        if target_lang in self.models:
-            return
+        model = self.models.get(target_lang)
+        if model is not None:
+            return model
             
-        model_path = self.model_dir / model_name
-        
-        if not model_path.exists():
-            logger.error(f"Path not found: {model_path}")
-            raise FileNotFoundError(f"Model missing for {target_lang}")
+        with self._load_locks[target_lang]:
+            # Another thread may have finished loading while we waited
+            if target_lang in self.models:
+                return self.models[target_lang]
+                
+            model_path = self.model_dir / model_name
             
-        logger.info(f"Loading AI Model for {target_lang}...")
-        
+            if not model_path.exists():
+                logger.error(f"Path not found: {model_path}")
+                raise FileNotFoundError(f"Model missing for {target_lang}")
+                
+            logger.info(f"Loading AI Model for {target_lang}...")
+            
+            try:
+                # Load from local folder; tokenizer first, since `models` is what callers check
+                self.tokenizers[target_lang] = MarianTokenizer.from_pretrained(str(model_path))
+                model = MarianMTModel.from_pretrained(str(model_path), dtype=self.dtype)
+                if self.dtype is None:
+                    # Weights are still as shipped, so this is the moment to convert them
+                    self._migrate_to_safetensors(model, model_path)
+                if self.quantize:
+                    # Re-done on every load: int8 packed weights only serialise through unsafe pickles
+                    model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+                self.models[target_lang] = model
+                precision = " (int8)" if self.quantize else " (bf16)" if self.dtype else ""
+                logger.success(f"Loaded {target_lang} model{precision}")
+            except Exception as e:
+                logger.critical(f"Failed to load model: {e}")
+                raise e
+            return model
+
+    def _migrate_to_safetensors(self, model, model_path):
+        """
+        One-time swap of a pickled pytorch_model.bin for model.safetensors (mmapped on later loads).
+        Best effort: a read-only install just keeps using the .bin.
+        """
+        bin_path = model_path / "pytorch_model.bin"
+        safe_path = model_path / "model.safetensors"
+        if not bin_path.exists() or safe_path.exists():
+            return
+            
+        tmp_dir = model_path / ".safetensors-tmp"
         try:
-            # Load from local folder
-            self.tokenizers[target_lang] = MarianTokenizer.from_pretrained(str(model_path))
-            self.models[target_lang] = MarianMTModel.from_pretrained(str(model_path))
-            logger.success(f"Loaded {target_lang} model")
-        except Exception as e:
-            logger.critical(f"Failed to load model: {e}")
-            raise e
+            # Written aside and moved in, so a crash never leaves a half-written model.safetensors
+            model.save_pretrained(tmp_dir, safe_serialization=True)
+            os.replace(tmp_dir / "model.safetensors", safe_path)
+            bin_path.unlink()
+            logger.info(f"Converted {model_path.name} to safetensors")
+        except OSError as e:
+            logger.warning(f"Could not convert {model_path.name} to safetensors: {e}")
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
 
-    def translate(self, text: str, target_lang: str) -> str:
+    def unload_model(self, target_lang):
+        """
+        Drops a loaded model so its memory can be reclaimed. Cached translations are kept.
+        """
+        lock = self._load_locks.get(target_lang)
+        if lock is None:
+            return
+        with lock:
+            # Model first, so nobody sees a model without its tokenizer
+            self.models.pop(target_lang, None)
+            self.tokenizers.pop(target_lang, None)
+
+    def translate(self, text: str, target_lang: str, max_new_tokens: int | None = None, num_beams: int | None = None) -> str:
+        """
+        max_new_tokens / num_beams override the model's generation defaults (e.g. a short greedy smoke test).
+        """
         if not text or not text.strip():
             return ""
             
+        gen_kwargs = {k: v for k, v in (("max_new_tokens", max_new_tokens), ("num_beams", num_beams)) if v is not None}
+        if gen_kwargs:
+            gen_kwargs["do_sample"] = False
+        # Overrides change the output, so they're part of the key; plain calls share entries with translate_batch
+        key = _cache_key(text, target_lang, *self._cache_variant, *sorted(gen_kwargs.items()))
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+            
         self.load_model(target_lang)
         
         tokenizer = self.tokenizers[target_lang]
@@ -61,7 +163,41 @@ class TranslationService:
         
         # Translate
         inputs = tokenizer(text, return_tensors="pt", padding=True, truncation=True)
-        translated = model.generate(**inputs) #kwargs
-        result = tokenizer.batch_decode(translated, skip_special_tokens=True)
+        # No autograd bookkeeping: we never backprop through translations
+        with torch.inference_mode():
+            translated = model.generate(**inputs, **gen_kwargs)
+        result = " ".join(tokenizer.batch_decode(translated, skip_special_tokens=True))
+        
+        _cache_put(key, result)
+        return result
+
+    def translate_batch(self, texts: list[str], target_lang: str, batch_size: int = 16) -> list[str]:
+        """
+        Translates many strings with as few generate() calls as possible.
+        Results line up with `texts`; blanks, duplicates and cached strings skip the model.
+        """
+        results = {}
+        pending = []
+        for t in dict.fromkeys(t for t in texts if t and t.strip()):
+            cached = _cache_get(_cache_key(t, target_lang, *self._cache_variant))
+            if cached is None: pending.append(t)
+            else: results[t] = cached
+        
+        if pending:
+            self.load_model(target_lang)
+            tokenizer = self.tokenizers[target_lang]
+            model = self.models[target_lang]
+            
+            # Similar lengths in the same batch means less padding
+            pending.sort(key=len)
+            for start in range(0, len(pending), batch_size):
+                chunk = pending[start:start + batch_size]
+                inputs = tokenizer(chunk, return_tensors="pt", padding=True, truncation=True)
+                with torch.inference_mode():
+                    translated = model.generate(**inputs)
+                decoded = tokenizer.batch_decode(translated, skip_special_tokens=True)
+                for t, value in zip(chunk, decoded):
+                    results[t] = value
+                    _cache_put(_cache_key(t, target_lang, *self._cache_variant), value)
         
-        return " ".join(result)
\ No newline at end of file
+        return [results.get(t, "") for t in texts]
\ No newline at end of file
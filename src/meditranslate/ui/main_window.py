@@ -55,6 +55,11 @@ class MainWindow(QMainWindow):
         about_action.triggered.connect(self._show_about)
         help_menu.addAction(about_action)
 
+    def closeEvent(self, event):
+        # Child widgets don't get closeEvent on their own; lets the tab release the camera
+        self.scanner_tab.close()
+        super().closeEvent(event)
+
     def _new_scan(self):
         self.scanner_tab.reset_state()
         self.status_bar.showMessage("New scan started")
@@ -10,83 +10,222 @@ Features:
 - Professional UI Layout (Grey Sidebar, Centered Headers)
 - Robust Threading & Error Handling
 """
+import hashlib
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-import cv2
 import numpy as np
-from pdf2image import convert_from_path
+from loguru import logger
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QFileDialog, QMessageBox, QGroupBox, QTextEdit, 
-    QScrollArea, QFrame, QStackedWidget, QSizePolicy, QComboBox, QCheckBox
+    QListView, QStyledItemDelegate, QStackedWidget, QSizePolicy, QComboBox, QCheckBox
 )
-from PySide6.QtCore import Qt, Signal, QThread, QObject
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, Signal, QObject, QRunnable, QThreadPool, QTimer, QRect, QSize
+from PySide6.QtGui import QStandardItemModel, QStandardItem, QColor, QFont, QFontMetrics, QPainter, QPen
 
-# Services
-from meditranslate.services.ocr_service import OCRService
-from meditranslate.services.analysis_service import AnalysisService
-from meditranslate.services.ai_assistant import AIAssistant
-from meditranslate.services.pdf_service import PDFService
-from meditranslate.utils.image_processing import ImageProcessor
+# Result text is styled per output language (see _apply_language_font)
+_LANG_FONTS = {
+    "Hindi": "'Noto Sans Devanagari', 'Noto Sans', sans-serif",
+}
+_DEFAULT_FONT = "'Segoe UI', sans-serif"
+
+# Services are imported where they're built, off the startup path
+
+# --- SHARED SERVICES (one instance per process, reused by every tab) ---
+@lru_cache(maxsize=1)
+def _get_ocr_service():
+    from meditranslate.services.ocr_service import OCRService
+    return OCRService()
+
+@lru_cache(maxsize=1)
+def _get_image_processor():
+    # Imported lazily: pulls in OpenCV, which the tab doesn't need until the first scan
+    from meditranslate.utils.image_processing import ImageProcessor
+    return ImageProcessor()
+
+# --- IMAGE INTAKE ---
+def _prepare_for_ocr(frame):
+    """Drops a BGR camera frame to a single grayscale channel before OCR."""
+    import cv2
+    if frame.ndim == 3:
+        # Straight to gray, skipping a full RGB copy
+        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    return frame
+
+def _render_pdf(path, max_edge):
+    """Renders every page straight to grayscale, with the long edge at max_edge."""
+    import pymupdf
+    pages = []
+    try:
+        with pymupdf.open(path) as doc:
+            for page in doc:
+                # ImageProcessor would only shrink anything larger, so don't render it
+                zoom = max_edge / max(page.rect.width, page.rect.height)
+                pix = page.get_pixmap(matrix=pymupdf.Matrix(zoom, zoom), colorspace=pymupdf.csGRAY, alpha=False)
+                pages.append(np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width))
+    except Exception as e:
+        raise RuntimeError(f"PDF Error: {e}") from e
+    return pages
+
+# Longer insight lists still go into the PDF export, just not the sidebar
+MAX_INSIGHTS = 50
+
+# --- RESULT CACHE (re-scanning the same page skips OCR & translation) ---
+_CACHE_SIZE = 16
+_cache_lock = threading.Lock()
+_OCR_CACHE = OrderedDict()     # (source_key, force_binary) -> raw_text
+_RESULT_CACHE = OrderedDict()  # (source_key, force_binary, lang) -> finished args
+
+def _image_key(pages):
+    h = hashlib.blake2b(digest_size=16)
+    for image in pages:
+        h.update(f"{image.shape}{image.dtype.str}".encode())
+        h.update(np.ascontiguousarray(image).data)
+    return h.digest()
+
+def _file_key(path):
+    # A PDF is keyed on its bytes, so a repeat scan skips rendering too
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).digest()
+
+def _cache_get(cache, key):
+    with _cache_lock:
+        if key not in cache: return None
+        cache.move_to_end(key)
+        return cache[key]
+
+def _cache_put(cache, key, value):
+    with _cache_lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > _CACHE_SIZE: cache.popitem(last=False)
 
 # --- WORKER 1: IMAGE PROCESSING, OCR & TRANSLATION ---
-class ProcessingWorker(QObject):
-    # Returns: (TranslatedText, DocType, InsightsList, RawEnglishText)
-    finished = Signal(str, str, list, str) 
-    error = Signal(str)
+class ProcessingSignals(QObject):
+    # Returns: (ScanId, TranslatedText, DocType, InsightsList, RawEnglishText)
+    finished = Signal(int, str, str, list, str) 
+    error = Signal(int, str)
 
-    def __init__(self, ocr, analysis, processor, image, target_lang, force_binary):
+# QRunnable is not a QObject, so its signals live on a small helper object
+class ProcessingWorker(QRunnable):
+    def __init__(self, scan_id, ocr, analysis, processor, source, target_lang, force_binary):
         super().__init__()
+        self.signals = ProcessingSignals()
+        # Echoed back so the tab can drop results from a scan it has moved on from
+        self.scan_id = scan_id
         self.ocr = ocr
         self.analysis = analysis
         self.processor = processor
-        self.image = image
+        # A list of page images, or a PDF path (rendered here, off the GUI thread)
+        self.source = source
         self.target_lang = target_lang
         self.force_binary = force_binary
 
     def run(self):
         try:
-            # 1. ENHANCE IMAGE (CPU Heavy - Run in thread)
-            # Apply High Contrast if checkbox was checked
-            processed_img = self.processor.enhance_for_ocr(self.image, self.force_binary)
+            # 0. CACHE LOOKUP (Same page + same settings = same result)
+            is_pdf = isinstance(self.source, str)
+            source_key = _file_key(self.source) if is_pdf else _image_key(self.source)
+            ocr_key = (source_key, self.force_binary)
+            result_key = (source_key, self.force_binary, self.target_lang)
+            cached = _cache_get(_RESULT_CACHE, result_key)
+            if cached is not None:
+                self.signals.finished.emit(self.scan_id, *cached)
+                return
+
+            # Stage timings (perf_counter_ns is cheap enough to leave on)
+            t_start = time.perf_counter_ns()
+            page_count = None if is_pdf else len(self.source)
+            raw_text = _cache_get(_OCR_CACHE, ocr_key)
+            if raw_text is None:
+                pages = _render_pdf(self.source, self.processor.MAX_EDGE) if is_pdf else self.source
+                page_count = len(pages)
+                # 1-2. ENHANCE + OCR every page (Tesseract runs as a subprocess, so threads overlap).
+                # A failed page raises, so only complete OCR output reaches the cache.
+                if len(pages) <= 1:
+                    page_texts = [self._read_page(page) for page in pages]
+                else:
+                    with ThreadPoolExecutor(max_workers=min(4, len(pages))) as ex:
+                        page_texts = list(ex.map(self._read_page, pages))
+                raw_text = "\n\n".join(t for t in page_texts if t)
+                _cache_put(_OCR_CACHE, ocr_key, raw_text)
+            t_ocr = time.perf_counter_ns()
             
-            # 2. OCR (Read English Text)
-            raw_text = self.ocr.extract_text(processed_img, lang='eng')
+            # Blank page / blurry frame: nothing to translate or analyze
+            if not raw_text or not raw_text.strip():
+                self.signals.finished.emit(self.scan_id, "", "", [], "")
+                return
             
             # 3. Detect Type
             doc_type = self.analysis.detect_document_type(raw_text)
+            t_type = time.perf_counter_ns()
             
-            # 4. Translate Document
-            translated_text = self.analysis.translate_content(raw_text, self.target_lang)
-            
-            # 5. Analyze (Get English Insights)
+            # 4. Analyze (Get English Insights)
             insights = self.analysis.analyze_text(raw_text)
-            
-            # 6. TRANSLATE INSIGHTS (Bilingual Data for PDF)
-            final_insights = []
-            seen = set()
+            unique = {}
             for item in insights:
-                orig_title = item.get('title', '')
-                if orig_title in seen: continue
-                seen.add(orig_title)
-                
-                # Translate Title & Description
-                item['trans_title'] = self.analysis.translate_content(orig_title, self.target_lang)
-                item['trans_desc'] = self.analysis.translate_content(item.get('desc', ''), self.target_lang)
-                
-                final_insights.append(item)
+                unique.setdefault(item.get('title', '').strip().lower(), item)
+            # Copy so glossary entries (and cached results) are never mutated
+            final_insights = [dict(item) for item in unique.values()]
+            t_analyze = time.perf_counter_ns()
+            
+            # 5. TRANSLATE DOCUMENT + INSIGHTS (One batch for the model, Bilingual Data for PDF)
+            paragraphs = raw_text.split("\n\n")
+            texts = list(paragraphs)
+            for item in final_insights:
+                texts.append(item.get('title', ''))
+                texts.append(item.get('desc', ''))
+            try:
+                translated = self.analysis.translate_batch(texts, self.target_lang)
+            except RuntimeError as e:
+                # One message for the whole document; insights fall back to their English text
+                translated = None
+                translated_text = str(e)
+                for item in final_insights:
+                    item['trans_title'] = item.get('title', '')
+                    item['trans_desc'] = item.get('desc', '')
             
-            self.finished.emit(translated_text, doc_type, final_insights, raw_text)
+            if translated is not None:
+                translated_text = "\n\n".join(translated[:len(paragraphs)])
+                offset = len(paragraphs)
+                for i, item in enumerate(final_insights):
+                    item['trans_title'] = translated[offset + 2 * i]
+                    item['trans_desc'] = translated[offset + 2 * i + 1]
+            t_end = time.perf_counter_ns()
+            
+            logger.debug(
+                f"Scan timings: PAGES={page_count or '-'} ENH+OCR={(t_ocr - t_start) / 1e6:.1f}ms "
+                f"TYPE={(t_type - t_ocr) / 1e6:.1f}ms INS={(t_analyze - t_type) / 1e6:.1f}ms "
+                f"TRL={(t_end - t_analyze) / 1e6:.1f}ms"
+            )
+            
+            result = (translated_text, doc_type, final_insights, raw_text)
+            # Failures must not outlive their cause (e.g. models downloaded later), so only cache successes
+            if translated is not None:
+                _cache_put(_RESULT_CACHE, result_key, result)
+            self.signals.finished.emit(self.scan_id, *result)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(self.scan_id, str(e))
+
+    def _read_page(self, page):
+        # Apply High Contrast if checkbox was checked
+        processed_img = self.processor.enhance_for_ocr(page, self.force_binary)
+        return self.ocr.extract_text(processed_img, lang='eng')
 
 # --- WORKER 2: AI QUERY (GEMINI) ---
-class AIQueryWorker(QObject):
+class AIQuerySignals(QObject):
     finished = Signal(str)
-    
+
+class AIQueryWorker(QRunnable):
     def __init__(self, ai_service, term, context, local_def, lang):
         super().__init__()
+        self.signals = AIQuerySignals()
         self.ai = ai_service
         self.term = term
         self.context = context
@@ -96,51 +235,195 @@ class AIQueryWorker(QObject):
     def run(self):
         # Calls Gemini with the Culturally Aware prompt
         response = self.ai.explain_term(self.term, self.local_def, self.context, self.lang)
-        self.finished.emit(response)
+        self.signals.finished.emit(response)
+
+# --- WORKER 3: CAMERA CAPTURE ---
+class CaptureSignals(QObject):
+    finished = Signal(object)  # BGR frame, or None if the camera failed
 
-# --- UI COMPONENT: INSIGHT CARD ---
-class InsightCard(QFrame):
-    def __init__(self, title, desc, card_type="info"):
+class CaptureWorker(QRunnable):
+    def __init__(self, read_frame):
         super().__init__()
-        self.setFrameShape(QFrame.Shape.StyledPanel)
-        self.setObjectName(f"Card_{card_type}")
-        
-        # Let layout handle height dynamically, but set minimum
-        self.setMinimumHeight(80)
-        
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(15, 15, 15, 15)
-        
-        # Title (Bold)
-        lbl_title = QLabel(title)
-        lbl_title.setWordWrap(True)
-        # Font will be set by parent based on language
-        lbl_title.setStyleSheet("font-weight: bold; font-size: 14px; color: #333; border: none;")
-        layout.addWidget(lbl_title)
-        
-        # Description
-        lbl_desc = QLabel(desc)
-        lbl_desc.setWordWrap(True)
-        lbl_desc.setStyleSheet("color: #555; font-size: 12px; border: none;")
-        layout.addWidget(lbl_desc)
+        self.signals = CaptureSignals()
+        self.read_frame = read_frame
+
+    def run(self):
+        # cap.read() blocks, so keep it off the GUI thread
+        try:
+            frame = self.read_frame()
+        except Exception:
+            frame = None
+        self.signals.finished.emit(frame)
+
+# --- WORKER 4: BACKGROUND WARMUP ---
+class WarmupWorker(QRunnable):
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+
+    def run(self):
+        try:
+            self.fn()
+        except Exception:
+            # Nothing above us on the pool would report it
+            logger.exception("Background task failed")
+
+# --- UI COMPONENT: INSIGHT CARDS ---
+# Item roles holding each insight's fields in the sidebar model
+TITLE_ROLE = Qt.ItemDataRole.UserRole
+DESC_ROLE = Qt.ItemDataRole.UserRole + 1
+TYPE_ROLE = Qt.ItemDataRole.UserRole + 2
+
+class InsightDelegate(QStyledItemDelegate):
+    """
+    Paints each insight as a card, so the list holds no per-card widgets.
+    """
+    # card_type -> (border colour, accent colour)
+    COLORS = {
+        "info": ("#E1F5FE", "#29B6F6"),
+        "warning": ("#FFF8E1", "#FFA726"),
+        "drug": ("#E8F5E9", "#66BB6A"),
+    }
+    PADDING = 15
+    ACCENT = 4
+    LINE_GAP = 6
+    CARD_GAP = 10
+    MIN_HEIGHT = 80
+
+    def _fonts(self, base):
+        # Family comes from the view (set per language by ScannerTab); sizes match the old card labels
+        title_font = QFont(base)
+        title_font.setPixelSize(14)
+        title_font.setBold(True)
+        desc_font = QFont(base)
+        desc_font.setPixelSize(12)
+        return title_font, desc_font
+
+    def _text_width(self, option):
+        view = option.widget
+        width = view.viewport().width() if view is not None else option.rect.width()
+        return max(1, width - self.ACCENT - 2 * self.PADDING)
+
+    def _text_heights(self, option, index, width):
+        title_font, desc_font = self._fonts(option.font)
+        flags = Qt.TextFlag.TextWordWrap
+        title_h = QFontMetrics(title_font).boundingRect(QRect(0, 0, width, 0), flags, index.data(TITLE_ROLE) or "").height()
+        desc_h = QFontMetrics(desc_font).boundingRect(QRect(0, 0, width, 0), flags, index.data(DESC_ROLE) or "").height()
+        return title_h, desc_h
+
+    def sizeHint(self, option, index):
+        width = self._text_width(option)
+        title_h, desc_h = self._text_heights(option, index, width)
+        height = max(self.MIN_HEIGHT, 2 * self.PADDING + title_h + self.LINE_GAP + desc_h)
+        return QSize(width, height + self.CARD_GAP)
+
+    def paint(self, painter, option, index):
+        border, accent = self.COLORS.get(index.data(TYPE_ROLE), self.COLORS["info"])
+        card = option.rect.adjusted(0, 0, -1, -self.CARD_GAP - 1)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(QColor(border), 1))
+        painter.setBrush(QColor("white"))
+        painter.drawRoundedRect(card, 6, 6)
+        painter.fillRect(QRect(card.left(), card.top(), self.ACCENT, card.height() + 1), QColor(accent))
+
+        width = self._text_width(option)
+        title_h, desc_h = self._text_heights(option, index, width)
+        title_font, desc_font = self._fonts(option.font)
+        left = card.left() + self.ACCENT + self.PADDING
+        top = card.top() + self.PADDING
+        flags = Qt.TextFlag.TextWordWrap
+
+        painter.setFont(title_font)
+        painter.setPen(QColor("#333333"))
+        painter.drawText(QRect(left, top, width, title_h), flags, index.data(TITLE_ROLE) or "")
+        painter.setFont(desc_font)
+        painter.setPen(QColor("#555555"))
+        painter.drawText(QRect(left, top + title_h + self.LINE_GAP, width, desc_h), flags, index.data(DESC_ROLE) or "")
+        painter.restore()
 
 # --- MAIN SCREEN LOGIC ---
 class ScannerTab(QWidget):
+    # Emitted from the pool once every service below has been built
+    services_ready = Signal()
+
     def __init__(self):
         super().__init__()
-        self.ocr_service = OCRService()
-        self.analysis_service = AnalysisService()
-        self.ai_assistant = AIAssistant()
-        self.pdf_service = PDFService()
-        self.image_processor = ImageProcessor()
+        # Built off the UI thread (see _load_services) so the window paints immediately
+        self.ocr_service = None
+        self.analysis_service = None
+        self.ai_assistant = None
+        self.pdf_service = None
+        # service attribute -> reason it failed to start
+        self._service_errors = {}
+        
+        # One long-lived pool instead of a new QThread per scan
+        self.pool = QThreadPool.globalInstance()
+        self.pool.setMaxThreadCount(2)
+        
+        # cv2.VideoCapture, opened on first use and kept open (see closeEvent)
+        self._cap = None
+        # CaptureWorker reads on the pool while closeEvent releases on the GUI thread
+        self._cap_lock = threading.Lock()
+        self._cap_closed = False
+        # Bumped per scan and on reset; results from older scans are ignored
+        self._scan_id = 0
         
         # State Data
         self.raw_text_cache = ""
         self.found_insights_cache = []
         self.last_result = {} 
+        self._font_lang = None
         
         self._setup_ui()
-        self._apply_styles()
+        
+        # Scanning needs the services; unlock the buttons once they're loaded
+        self.btn_upload.setEnabled(False)
+        self.btn_camera.setEnabled(False)
+        self.services_ready.connect(self._on_services_ready)
+        # Start once the event loop is running so the window paints first
+        QTimer.singleShot(0, lambda: self.pool.start(WarmupWorker(self._load_services)))
+
+    def _load_services(self):
+        # Runs on the pool, so the service imports (Gemini SDK, ReportLab, ...) stay off the startup path too.
+        # Each service is built on its own: a missing dependency only disables the features that need it.
+        def analysis():
+            from meditranslate.services.analysis_service import AnalysisService
+            return AnalysisService()
+
+        def ai():
+            from meditranslate.services.ai_assistant import AIAssistant
+            return AIAssistant()
+
+        def pdf():
+            from meditranslate.services.pdf_service import PDFService
+            return PDFService()
+
+        try:
+            for attr, build in (("ocr_service", _get_ocr_service), ("analysis_service", analysis),
+                                ("ai_assistant", ai), ("pdf_service", pdf)):
+                try:
+                    setattr(self, attr, build())
+                except Exception as e:
+                    logger.exception(f"Failed to start {attr}")
+                    self._service_errors[attr] = str(e)
+        finally:
+            self.services_ready.emit()
+
+    def _on_services_ready(self):
+        self.btn_upload.setEnabled(True)
+        self.btn_camera.setEnabled(True)
+        if self._service_errors:
+            details = "\n".join(f"- {name}: {err}" for name, err in self._service_errors.items())
+            QMessageBox.warning(self, "Startup Problem", f"Some features failed to start and are unavailable:\n{details}")
+
+    def _service_missing(self, *attrs):
+        """Returns a user-facing reason if any of the named services failed to start, else None."""
+        for attr in attrs:
+            if getattr(self, attr) is None:
+                return f"{attr} is unavailable: {self._service_errors.get(attr, 'still starting')}"
+        return None
 
     def _setup_ui(self):
         self.main_layout = QVBoxLayout(self)
@@ -289,23 +572,28 @@ class ScannerTab(QWidget):
         self.ai_response_area.setObjectName("AIResponse")
         self.ai_response_area.setMinimumHeight(150)
         
-        # 3. Static Cards List
-        self.ai_scroll = QScrollArea()
-        self.ai_scroll.setWidgetResizable(True)
-        self.ai_scroll.setFrameShape(QFrame.Shape.NoFrame)
-        self.ai_scroll.setStyleSheet("background: transparent;")
-        
-        self.ai_container = QWidget()
-        self.ai_layout = QVBoxLayout(self.ai_container)
-        self.ai_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        self.ai_layout.setSpacing(10)
-        self.ai_layout.setContentsMargins(0,0,0,0)
-        self.ai_scroll.setWidget(self.ai_container)
+        # 3. Static Cards List (painted by InsightDelegate; only visible rows cost anything)
+        self.insight_model = QStandardItemModel(self)
+        self.insight_list = QListView()
+        self.insight_list.setObjectName("InsightList")
+        self.insight_list.setModel(self.insight_model)
+        self.insight_list.setItemDelegate(InsightDelegate(self.insight_list))
+        self.insight_list.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.insight_list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.insight_list.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.insight_list.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.insight_list.setStyleSheet("background: transparent; border: none;")
+        # Re-run sizeHint on resize so wrapped card text reflows
+        self.insight_list.setResizeMode(QListView.ResizeMode.Adjust)
+        
+        self.lbl_no_terms = QLabel("No specific terms found.")
+        self.lbl_no_terms.hide()
         
         sidebar_layout.addWidget(lbl_ai_title)
         sidebar_layout.addWidget(question_box)
         sidebar_layout.addWidget(self.ai_response_area)
-        sidebar_layout.addWidget(self.ai_scroll)
+        sidebar_layout.addWidget(self.lbl_no_terms)
+        sidebar_layout.addWidget(self.insight_list)
         
         # Combine Panels
         results_layout.addWidget(left_panel, stretch=1)
@@ -314,157 +602,151 @@ class ScannerTab(QWidget):
         self.stack.addWidget(self.view_upload)
         self.stack.addWidget(self.view_results)
 
-    def _apply_styles(self):
-        self.setStyleSheet("""
-            QWidget { background-color: #FFFFFF; font-family: 'Segoe UI', sans-serif; }
-            
-            /* Sidebar Container */
-            QWidget#Sidebar {
-                background-color: #F8F9FA;
-                border-left: 1px solid #E0E0E0;
-            }
-            
-            QLabel#TitleLabel { font-size: 36px; font-weight: bold; color: #263238; }
-            QLabel#SubHeader { color: #666; font-size: 16px; margin-bottom: 5px; }
-            
-            QComboBox { border: 1px solid #B0BEC5; border-radius: 6px; padding: 8px; background: white; font-size: 14px; }
-            QCheckBox { font-size: 14px; color: #555; font-weight: bold; spacing: 8px; }
-            
-            /* Big Buttons */
-            QPushButton#BigButton {
-                background-color: white; border: 2px solid #E0E0E0;
-                border-radius: 12px; font-size: 18px; font-weight: bold; color: #455A64;
-            }
-            QPushButton#BigButton:hover {
-                background-color: #E3F2FD; border-color: #2196F3; color: #1976D2;
-            }
-            
-            QTextEdit#Editor {
-                border: 1px solid #E0E0E0; border-radius: 8px; background-color: white; padding: 25px;
-                font-family: 'Noto Sans Devanagari', 'Noto Sans', sans-serif; font-size: 15px; line-height: 1.6;
-            }
-            
-            /* AI Box */
-            QGroupBox#AIBox {
-                font-weight: bold; border: 1px solid #CFD8DC; border-radius: 8px; 
-                background-color: white; padding-top: 25px; margin-top: 5px;
-            }
-            
-            QPushButton#ActionButton {
-                background-color: #673AB7; color: white; border-radius: 6px; padding: 12px; font-weight: bold; border: none;
-            }
-            QPushButton#ActionButton:hover { background-color: #7E57C2; }
-            
-            QTextEdit#AIResponse {
-                border: none; background-color: #F3E5F5; border-radius: 12px; padding: 15px;
-                color: #4A148C; font-family: 'Noto Sans Devanagari', 'Noto Sans', sans-serif; font-size: 14px;
-            }
-            
-            QPushButton#ResetButton {
-                background-color: #FFEBEE; color: #D32F2F; border: none; padding: 12px 24px; border-radius: 6px; font-weight: bold;
-            }
-            QPushButton#ExportButton {
-                background-color: #2E7D32; color: white; border: none; padding: 12px 24px; border-radius: 6px; font-weight: bold;
-            }
-            
-            /* Cards on Grey Background need White BG */
-            QFrame#Card_info { background-color: white; border: 1px solid #E1F5FE; border-left: 4px solid #29B6F6; border-radius: 6px; }
-            QFrame#Card_warning { background-color: white; border: 1px solid #FFF8E1; border-left: 4px solid #FFA726; border-radius: 6px; }
-            QFrame#Card_drug { background-color: white; border: 1px solid #E8F5E9; border-left: 4px solid #66BB6A; border-radius: 6px; }
-            
-            QScrollBar:vertical { border: none; background: #E0E0E0; width: 10px; margin: 0px; border-radius: 5px; }
-            QScrollBar::handle:vertical { background: #90A4AE; min-height: 30px; border-radius: 5px; }
-        """)
-
     def _upload_file(self):
         path, _ = QFileDialog.getOpenFileName(self, "Select Doc", str(Path.home()), "Documents (*.png *.jpg *.pdf)")
         if path:
-            if path.lower().endswith('.pdf'): self._process_pdf(path)
+            if path.lower().endswith('.pdf'): self._start_processing(path)
             else:
-                img = cv2.imread(path)
-                if img is not None: self._start_processing(cv2.cvtColor(img, cv2.COLOR_BGR2RGB))
-
-    def _process_pdf(self, path):
-        try:
-            images = convert_from_path(path, first_page=1, last_page=1)
-            if images: self._start_processing(np.array(images[0]))
-        except Exception as e: QMessageBox.warning(self, "Error", f"PDF Error: {e}")
+                import cv2
+                try:
+                    # Read bytes ourselves: one buffered read, and works with non-ASCII paths on Windows.
+                    # Decoding straight to grayscale never materialises the 3-channel image.
+                    img = cv2.imdecode(np.fromfile(path, dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+                except (OSError, cv2.error) as e:
+                    # Unreadable/locked file (OSError) or an empty one (cv2.error on the empty buffer)
+                    QMessageBox.warning(self, "Error", f"Image Error: {e}")
+                    return
+                if img is not None: self._start_processing([img])
 
     def _capture_camera(self):
-        try:
-            cap = cv2.VideoCapture(0)
-            if not cap.isOpened(): cap = cv2.VideoCapture(1)
-            for _ in range(10): cap.read()
-            ret, frame = cap.read()
-            cap.release()
-            if ret: self._start_processing(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-        except Exception: pass
-
-    def _start_processing(self, image):
+        self.btn_camera.setEnabled(False)
+        task = CaptureWorker(self._read_camera_frame)
+        task.signals.finished.connect(self._on_camera_frame)
+        self.pool.start(task)
+
+    def _read_camera_frame(self):
+        with self._cap_lock:
+            if self._cap_closed: return None
+            frame = None
+            try:
+                frame = self._grab_frame()
+                return frame
+            finally:
+                if frame is None and self._cap is not None:
+                    # Unplugged or taken by another app; reopen on the next capture
+                    self._cap.release()
+                    self._cap = None
+
+    def _grab_frame(self):
+        import cv2
+        if self._cap is None:
+            # Backend auto-detection probes every API in turn (slow on Windows)
+            backend = {"win32": cv2.CAP_DSHOW, "linux": cv2.CAP_V4L2}.get(sys.platform, cv2.CAP_ANY)
+            cap = None
+            for index in (0, 1):
+                for api in dict.fromkeys((backend, cv2.CAP_ANY)):
+                    cap = cv2.VideoCapture(index, api)
+                    if cap.isOpened(): break
+                if cap.isOpened(): break
+            if not cap.isOpened(): return None
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            # V4L2 only starts streaming on the first grab, so a sleep would not let
+            # auto-exposure settle; grab (without decoding) a few frames instead
+            for _ in range(5): cap.grab()
+            self._cap = cap
+        # grab() drops whatever is queued; only the frame we keep gets decoded
+        if not self._cap.grab(): return None
+        ret, frame = self._cap.retrieve()
+        return frame if ret else None
+
+    def _on_camera_frame(self, frame):
+        self.btn_camera.setEnabled(True)
+        if frame is not None: self._start_processing([_prepare_for_ocr(frame)])
+
+    def closeEvent(self, event):
+        # Waits out a read in progress; later captures return None
+        with self._cap_lock:
+            self._cap_closed = True
+            if self._cap is not None:
+                self._cap.release()
+                self._cap = None
+        super().closeEvent(event)
+
+    def _start_processing(self, source):
+        missing = self._service_missing("ocr_service", "analysis_service")
+        if missing:
+            QMessageBox.warning(self, "Error", f"Cannot scan. {missing}")
+            return
         target = self.lang_select.currentText()
         use_contrast = self.chk_contrast.isChecked()
+        self._scan_id += 1
         self.stack.setCurrentIndex(1)
         self.text_editor.setText(f"Processing...")
         self.term_selector.clear()
         self.ai_response_area.clear()
         self.btn_export.setEnabled(False)
         
-        while self.ai_layout.count():
-            child = self.ai_layout.takeAt(0)
-            if child.widget(): child.widget().deleteLater()
-        
-        self.thread = QThread()
-        self.worker = ProcessingWorker(self.ocr_service, self.analysis_service, self.image_processor, image, target, use_contrast)
-        self.worker.moveToThread(self.thread)
-        self.thread.started.connect(self.worker.run)
-        self.worker.finished.connect(self._on_process_finished)
-        self.worker.error.connect(self._on_process_error)
-        self.worker.finished.connect(self.thread.quit)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.thread.finished.connect(self.thread.deleteLater)
-        self.thread.start()
-
-    def _on_process_finished(self, text, doc_type, insights, raw_text):
+        self.insight_model.clear()
+        self.lbl_no_terms.hide()
+        
+        task = ProcessingWorker(self._scan_id, self.ocr_service, self.analysis_service, _get_image_processor(), source, target, use_contrast)
+        task.signals.finished.connect(self._on_process_finished)
+        task.signals.error.connect(self._on_process_error)
+        self.pool.start(task)
+
+    def _on_process_finished(self, scan_id, text, doc_type, insights, raw_text):
+        if scan_id != self._scan_id: return
         if not raw_text or not raw_text.strip():
-            QMessageBox.warning(self, "No Text", "Could not read text. Try High Contrast mode.")
+            QMessageBox.warning(self, "No Text", "No text detected. Try High Contrast mode or another image.")
+            self.text_editor.clear()
             self.text_editor.setPlaceholderText("Scan failed. Try again.")
             self.btn_reset.setEnabled(True)
             return
 
         self.text_editor.setText(text)
         current_lang = self.lang_select.currentText()
-        
-        if "Hindi" in current_lang:
-            font = QFont("Noto Sans Devanagari", 14)
-        else:
-            font = QFont("Segoe UI", 14)
-        self.text_editor.setFont(font)
-        self.ai_response_area.setFont(font)
+        self._apply_language_font(current_lang)
 
         self.raw_text_cache = raw_text
         self.found_insights_cache = insights
         self.btn_export.setEnabled(True)
         self.last_result = {"text": text, "type": doc_type, "insights": insights, "lang": current_lang, "original_text": raw_text, "translated_text": text}
         
-        seen = set()
-        for item in insights:
-            display_title = item.get('trans_title', item.get('title', 'Unknown'))
-            if display_title not in seen:
+        # Fill the model with painting off, then lay out and repaint once
+        self.insight_list.setUpdatesEnabled(False)
+        try:
+            shown = insights[:MAX_INSIGHTS]
+            for item in shown:
+                # The worker already deduplicated insights by title
+                display_title = item.get('trans_title', item.get('title', 'Unknown'))
                 self.term_selector.addItem(display_title)
-                seen.add(display_title)
+                
+                row = QStandardItem()
+                row.setData(display_title, TITLE_ROLE)
+                row.setData(item.get('trans_desc', ''), DESC_ROLE)
+                row.setData(item.get('type', 'info'), TYPE_ROLE)
+                self.insight_model.appendRow(row)
             
-            card = InsightCard(display_title, item.get('trans_desc', ''), item.get('type', 'info'))
-            for child in card.findChildren(QLabel): child.setFont(font)
-            self.ai_layout.addWidget(card)
-        
-        if not insights: self.ai_layout.addWidget(QLabel("No specific terms found."))
-        self.ai_layout.addStretch()
+            self.lbl_no_terms.setVisible(not shown)
+        finally:
+            self.insight_list.setUpdatesEnabled(True)
         
         enable_ai = self.term_selector.count() > 0
         self.term_selector.setEnabled(enable_ai)
         self.btn_explain.setEnabled(enable_ai)
 
-    def _on_process_error(self, err):
+    def _apply_language_font(self, lang):
+        # One tab-level rule that children inherit; replaced (not appended) and only when the language changes
+        if lang == self._font_lang: return
+        self._font_lang = lang
+        family = next((f for key, f in _LANG_FONTS.items() if key in lang), _DEFAULT_FONT)
+        self.setStyleSheet(
+            "QTextEdit#Editor, QTextEdit#AIResponse, QListView#InsightList "
+            f"{{ font-family: {family}; }}"
+        )
+
+    def _on_process_error(self, scan_id, err):
+        if scan_id != self._scan_id: return
         self.text_editor.setText(f"Error: {err}")
         self.btn_reset.setEnabled(True)
 
@@ -477,24 +759,32 @@ class ScannerTab(QWidget):
                 local_def = item.get('trans_desc', '')
                 break
         
+        missing = self._service_missing("ai_assistant")
+        if missing:
+            self.ai_response_area.setMarkdown(f"**AI Error:** {missing}")
+            return
+
+        cached = self.ai_assistant.cached_explanation(term, self.raw_text_cache, target)
+        if cached is not None:
+            self._on_ai_finished(cached)
+            return
+
         self.ai_response_area.setMarkdown(f"**Asking AI about '{term}'...**")
         self.btn_explain.setEnabled(False)
         
-        self.ai_thread = QThread()
-        self.ai_worker = AIQueryWorker(self.ai_assistant, term, self.raw_text_cache, local_def, target)
-        self.ai_worker.moveToThread(self.ai_thread)
-        self.ai_thread.started.connect(self.ai_worker.run)
-        self.ai_worker.finished.connect(self._on_ai_finished)
-        self.ai_worker.finished.connect(self.ai_thread.quit)
-        self.ai_worker.finished.connect(self.ai_worker.deleteLater)
-        self.ai_thread.finished.connect(self.ai_thread.deleteLater)
-        self.ai_thread.start()
+        task = AIQueryWorker(self.ai_assistant, term, self.raw_text_cache, local_def, target)
+        task.signals.finished.connect(self._on_ai_finished)
+        self.pool.start(task)
 
     def _on_ai_finished(self, response):
         self.ai_response_area.setMarkdown(response)
         self.btn_explain.setEnabled(True)
 
     def _export_pdf(self):
+        missing = self._service_missing("pdf_service")
+        if missing:
+            QMessageBox.warning(self, "Export Error", missing)
+            return
         try:
             lang_key = self.last_result.get('lang', 'Report').replace(" ", "")
             default_name = f"MediTranslate_{lang_key}.pdf"
@@ -522,6 +812,7 @@ class ScannerTab(QWidget):
             QMessageBox.critical(self, "Export Error", str(e))
 
     def reset_state(self):
+        self._scan_id += 1
         self.stack.setCurrentIndex(0)
         self.text_editor.clear()
         self.ai_response_area.clear()
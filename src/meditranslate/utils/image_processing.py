@@ -7,10 +7,16 @@ import numpy as np
 from loguru import logger
 
 class ImageProcessor:
+    # Long-edge cap before denoising; filtering and Tesseract both scale with pixel count
+    MAX_EDGE = 1800
+
     def __init__(self):
         logger.debug("ImageProcessor initialized")
     
     def enhance_for_ocr(self, image: np.ndarray, force_binary: bool = False) -> np.ndarray:
+        """
+        Returns a single-channel image ready for Tesseract.
+        """
         if image is None or image.size == 0:
             return image
 
@@ -20,7 +26,13 @@ class ImageProcessor:
             else:
                 gray = image
             
-            denoised = cv2.fastNlMeansDenoising(gray, None, h=10, templateWindowSize=7, searchWindowSize=21)
+            h, w = gray.shape[:2]
+            scale = min(1.0, self.MAX_EDGE / max(h, w))
+            if scale < 1.0:
+                gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            
+            # Small bilateral filter: keeps glyph edges, a fraction of NLMeans' cost
+            denoised = cv2.bilateralFilter(gray, d=5, sigmaColor=50, sigmaSpace=50)
             
             if force_binary:
                 _, processed = cv2.threshold(denoised, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
@@ -28,34 +40,43 @@ class ImageProcessor:
                 clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
                 processed = clahe.apply(denoised)
             
-            final = self._deskew(processed)
-            
-            return cv2.cvtColor(final, cv2.COLOR_GRAY2RGB)
+            # Stay single-channel: an RGB copy would triple the bytes written out for Tesseract
+            return self._deskew(processed)
             
         except Exception as e:
             logger.error(f"Enhancement pipeline failed: {e}")
             return image
 
     def _deskew(self, gray_image):
-        edges = cv2.Canny(gray_image, 50, 150, apertureSize=3)
-        lines = cv2.HoughLines(edges, 1, np.pi / 180, 200)
-        
-        if lines is None: return gray_image
-        
-        angles = []
-        for line in lines:
-            rho, theta = line[0]
-            angle = np.degrees(theta) - 90
-            angles.append(angle)
+        (h, w) = gray_image.shape
+        # Estimate on a ~400px-wide copy; the angle does not depend on resolution
+        scale = min(1.0, 400 / w)
+        small = cv2.resize(gray_image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA) if scale < 1.0 else gray_image
+        _, bw = cv2.threshold(small, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
         
-        if not angles: return gray_image
-        median_angle = np.median(angles)
+        sh, sw = bw.shape
+        small_center = (sw // 2, sh // 2)
+
+        def best_of(angles):
+            best_angle, best_score = 0.0, -1.0
+            for angle in angles:
+                M = cv2.getRotationMatrix2D(small_center, float(angle), 1.0)
+                rotated = cv2.warpAffine(bw, M, (sw, sh), flags=cv2.INTER_NEAREST, borderValue=0)
+                # Aligned text lines give sharp jumps between ink rows and blank rows
+                proj = rotated.sum(axis=1, dtype=np.float64)
+                score = float((np.diff(proj) ** 2).sum())
+                if score > best_score:
+                    best_angle, best_score = float(angle), score
+            return best_angle
+
+        # Coarse 2° steps over the same ±15° the Hough version covered, then refine to 0.25°
+        coarse = best_of(np.arange(-14, 15, 2))
+        best_angle = best_of(np.linspace(coarse - 1, coarse + 1, 9))
         
-        if abs(median_angle) > 15 or abs(median_angle) < 0.5:
+        if abs(best_angle) < 0.5:
             return gray_image
             
-        (h, w) = gray_image.shape
         center = (w // 2, h // 2)
-        M = cv2.getRotationMatrix2D(center, median_angle, 1.0)
+        M = cv2.getRotationMatrix2D(center, best_angle, 1.0)
 
         return cv2.warpAffine(gray_image, M, (w, h), flags=cv2.INTER_CUBIC, borderMode=cv2.BORDER_CONSTANT, borderValue=(255, 255, 255))
\ No newline at end of file
@@ -0,0 +1,88 @@
+"""
+tests/debug_models_daemon.py
+Keeps the translation models loaded between debug runs.
+Start it once; while its socket exists, debug_models.py sends its test
+translations here instead of loading the models itself.
+Unix-only (uses a Unix domain socket).
+"""
+
+import sys
+import os
+import json
+import socket
+from pathlib import Path
+
+SOCKET_PATH = "/tmp/meditranslate.sock"
+
+
+def request(payload):
+    """
+    Sends one JSON request to the daemon and returns its JSON reply.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.connect(SOCKET_PATH)
+        conn.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+        with conn.makefile("r", encoding="utf-8") as reader:
+            return json.loads(reader.readline())
+
+
+def _handle(service, payload):
+    op = payload.get("op")
+    if op == "ping":
+        return {"ok": True, "loaded": sorted(service.models)}
+    if op == "translate":
+        result = service.translate(
+            payload["text"], payload["lang"],
+            max_new_tokens=payload.get("max_new_tokens"), num_beams=payload.get("num_beams"),
+        )
+        return {"ok": True, "result": result}
+    return {"ok": False, "error": f"Unknown op: {op}"}
+
+
+def main():
+    if not hasattr(socket, "AF_UNIX"):
+        print("Unix domain sockets are not available on this platform.")
+        sys.exit(1)
+
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+    from meditranslate.services.translation_service import TranslationService
+
+    print("Loading models...")
+    service = TranslationService()
+    for lang in service.model_map:
+        service.load_model(lang)
+        print(f"   {lang} Model Loaded into RAM.")
+
+    if os.path.exists(SOCKET_PATH):
+        os.unlink(SOCKET_PATH)
+
+    # Owner-only socket: requests carry document text
+    old_umask = os.umask(0o177)
+    try:
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(SOCKET_PATH)
+    finally:
+        os.umask(old_umask)
+
+    print(f"Listening on {SOCKET_PATH} (Ctrl+C to stop)")
+    try:
+        with server:
+            server.listen()
+            while True:
+                conn, _ = server.accept()
+                with conn, conn.makefile("rw", encoding="utf-8") as stream:
+                    try:
+                        reply = _handle(service, json.loads(stream.readline()))
+                    except Exception as e:
+                        reply = {"ok": False, "error": str(e)}
+                    stream.write(json.dumps(reply) + "\n")
+                    stream.flush()
+    except KeyboardInterrupt:
+        print("\nStopping.")
+    finally:
+        if os.path.exists(SOCKET_PATH):
+            os.unlink(SOCKET_PATH)
+
+
+if __name__ == "__main__":
+    main()